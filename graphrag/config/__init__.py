@@ -65,6 +65,7 @@ from .models import (
     UmapConfig,
 )
 from .read_dotenv import read_dotenv
+from .read_settings_file import read_settings_file
 
 __all__ = [
     "ApiKeyMissingError",
@@ -120,4 +121,5 @@ __all__ = [
     "UmapConfigInput",
     "create_graphrag_config",
     "read_dotenv",
+    "read_settings_file",
 ]
@@ -0,0 +1,40 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the read_settings_file utility."""
+
+import copy
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
+
+from .create_graphrag_config import create_graphrag_config
+from .input_models import GraphRagConfigInput
+from .models import GraphRagConfig
+
+
+def read_settings_file(root: str, settings_file: Path) -> GraphRagConfig:
+    """Parse a yaml or json settings file into a GraphRagConfig.
+
+    Only the parsed file is cached, until it changes. The config is rebuilt on every
+    call, so the .env file and environment variables are always read fresh.
+    """
+    data = _parse_settings_file(str(settings_file), settings_file.stat().st_mtime_ns)
+    # create_graphrag_config expands env-var tokens in place
+    return create_graphrag_config(copy.deepcopy(data), root)
+
+
+@lru_cache(maxsize=16)
+def _parse_settings_file(
+    settings_file: str,
+    mtime_ns: int,  # noqa: ARG001
+) -> GraphRagConfigInput:
+    settings_path = Path(settings_file)
+    with settings_path.open("rb") as file:
+        content = file.read().decode(encoding="utf-8", errors="strict")
+
+    if settings_path.suffix in [".yaml", ".yml"]:
+        return yaml.safe_load(content)
+    return json.loads(content)
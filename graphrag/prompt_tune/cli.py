@@ -3,6 +3,8 @@
 
 """Command line interface for the fine_tune module."""
 
+import asyncio
+import os
 from pathlib import Path
 
 from datashaper import NoopVerbCallbacks
@@ -13,6 +15,9 @@ from graphrag.index.progress import PrintProgressReporter
 from graphrag.index.progress.types import ProgressReporter
 from graphrag.llm.types.llm_types import CompletionLLM
 from graphrag.prompt_tune.generator import (
+    COMMUNITY_SUMMARIZATION_FILENAME,
+    ENTITY_EXTRACTION_FILENAME,
+    ENTITY_SUMMARIZATION_FILENAME,
     MAX_TOKEN_COUNT,
     create_community_summarization_prompt,
     create_entity_extraction_prompt,
@@ -230,28 +235,24 @@ async def generate_indexing_prompts(
     reporter.info("Done generating entity relationship examples")
 
     reporter.info("Generating entity extraction prompt...")
-    create_entity_extraction_prompt(
+    entity_extraction_prompt = create_entity_extraction_prompt(
         entity_types=entity_types,
         docs=doc_list,
         examples=examples,
         language=language,
         json_mode=False,  # config.llm.model_supports_json should be used, but this prompts are used in non-json by the index engine
-        output_path=output_path,
         encoding_model=config.encoding_model,
         max_token_count=max_tokens,
         min_examples_required=min_examples_required,
     )
-    reporter.info(f"Generated entity extraction prompt, stored in folder {output_path}")
+    reporter.info("Generated entity extraction prompt")
 
     reporter.info("Generating entity summarization prompt...")
-    create_entity_summarization_prompt(
+    entity_summarization_prompt = create_entity_summarization_prompt(
         persona=persona,
         language=language,
-        output_path=output_path,
-    )
-    reporter.info(
-        f"Generated entity summarization prompt, stored in folder {output_path}"
     )
+    reporter.info("Generated entity summarization prompt")
 
     reporter.info("Generating community reporter role...")
     community_reporter_role = await generate_community_reporter_role(
@@ -260,13 +261,53 @@ async def generate_indexing_prompts(
     reporter.info(f"Generated community reporter role: {community_reporter_role}")
 
     reporter.info("Generating community summarization prompt...")
-    create_community_summarization_prompt(
+    community_summarization_prompt = create_community_summarization_prompt(
         persona=persona,
         role=community_reporter_role,
         report_rating_description=community_report_ranking,
         language=language,
-        output_path=output_path,
     )
-    reporter.info(
-        f"Generated community summarization prompt, stored in folder {output_path}"
+    reporter.info("Generated community summarization prompt")
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    entity_extraction_prompt_path = output_path / ENTITY_EXTRACTION_FILENAME
+    entity_summarization_prompt_path = output_path / ENTITY_SUMMARIZATION_FILENAME
+    community_summarization_prompt_path = output_path / COMMUNITY_SUMMARIZATION_FILENAME
+    encoded_prompts = [
+        prompt.encode(encoding="utf-8", errors="strict")
+        for prompt in [
+            entity_extraction_prompt,
+            entity_summarization_prompt,
+            community_summarization_prompt,
+        ]
+    ]
+
+    # Write the prompt files concurrently so disk I/O does not block the event loop
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(_write_bytes, path, encoded_prompt)
+            for path, encoded_prompt in zip(
+                [
+                    entity_extraction_prompt_path,
+                    entity_summarization_prompt_path,
+                    community_summarization_prompt_path,
+                ],
+                encoded_prompts,
+                strict=True,
+            )
+        )
     )
+    reporter.info(f"Prompts stored in folder {output_path}")
+
+
+def _write_bytes(path: Path, content: bytes) -> None:
+    # the prompts are regenerated on demand, so write straight to the descriptor
+    # without buffering and without forcing an fsync
+    data = memoryview(content)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
@@ -5,7 +5,7 @@
 
 from pathlib import Path
 
-from graphrag.config import create_graphrag_config
+from graphrag.config import create_graphrag_config, read_settings_file
 from graphrag.index.progress.types import ProgressReporter
 
 
@@ -23,21 +23,10 @@ def read_config_parameters(root: str, reporter: ProgressReporter):
         settings_yaml = _root / "settings.yml"
     settings_json = _root / "settings.json"
 
-    if settings_yaml.exists():
-        reporter.info(f"Reading settings from {settings_yaml}")
-        with settings_yaml.open("rb") as file:
-            import yaml
-
-            data = yaml.safe_load(file.read().decode(encoding="utf-8", errors="strict"))
-            return create_graphrag_config(data, root)
-
-    if settings_json.exists():
-        reporter.info(f"Reading settings from {settings_json}")
-        with settings_json.open("rb") as file:
-            import json
-
-            data = json.loads(file.read().decode(encoding="utf-8", errors="strict"))
-            return create_graphrag_config(data, root)
+    for settings_file in (settings_yaml, settings_json):
+        if settings_file.exists():
+            reporter.info(f"Reading settings from {settings_file}")
+            return read_settings_file(root, settings_file)
 
     reporter.info("Reading settings from environment variables")
     return create_graphrag_config(root_dir=root)
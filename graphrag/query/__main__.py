@@ -6,7 +6,12 @@
 import argparse
 from enum import Enum
 
-from .cli import run_global_search, run_local_search
+from .cli import (
+    run_global_search,
+    run_global_search_batch,
+    run_local_search,
+    run_local_search_batch,
+)
 
 INVALID_METHOD_ERROR = "Invalid method"
 
@@ -71,15 +76,15 @@ if __name__ == "__main__":
 
     parser.add_argument(
         "query",
-        nargs=1,
-        help="The query to run",
+        nargs="+",
+        help="The query to run, multiple queries are run as a batch",
         type=str,
     )
 
     args = parser.parse_args()
 
-    match args.method:
-        case SearchType.LOCAL:
+    match args.method, len(args.query) > 1:
+        case SearchType.LOCAL, False:
             run_local_search(
                 args.config,
                 args.data,
@@ -88,7 +93,16 @@ if __name__ == "__main__":
                 args.response_type,
                 args.query[0],
             )
-        case SearchType.GLOBAL:
+        case SearchType.LOCAL, True:
+            run_local_search_batch(
+                args.config,
+                args.data,
+                args.root,
+                args.community_level,
+                args.response_type,
+                args.query,
+            )
+        case SearchType.GLOBAL, False:
             run_global_search(
                 args.config,
                 args.data,
@@ -97,5 +111,14 @@ if __name__ == "__main__":
                 args.response_type,
                 args.query[0],
             )
+        case SearchType.GLOBAL, True:
+            run_global_search_batch(
+                args.config,
+                args.data,
+                args.root,
+                args.community_level,
+                args.response_type,
+                args.query,
+            )
         case _:
             raise ValueError(INVALID_METHOD_ERROR)
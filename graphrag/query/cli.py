@@ -3,40 +3,80 @@
 
 """Command line interface for the query module."""
 
+import asyncio
+import hashlib
+import logging
 import os
+import sys
+import threading
+from collections.abc import Awaitable
+from functools import lru_cache
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
+from datashaper import Progress
 
 from graphrag.config import (
     GraphRagConfig,
     create_graphrag_config,
+    read_settings_file,
 )
-from graphrag.index.progress import PrintProgressReporter
-from graphrag.model.entity import Entity
+from graphrag.index.progress import PrintProgressReporter, ProgressReporter
+from graphrag.model import Covariate, Entity
 from graphrag.query.input.loaders.dfs import (
     store_entity_semantic_embeddings,
 )
-from graphrag.vector_stores import VectorStoreFactory, VectorStoreType
+from graphrag.vector_stores import BaseVectorStore, VectorStoreFactory, VectorStoreType
 from graphrag.vector_stores.lancedb import LanceDBVectorStore
 
 from .factories import get_global_search_engine, get_local_search_engine
 from .indexer_adapters import (
+    INDEXER_CATEGORICAL_COLUMNS,
+    INDEXER_OUTPUT_COLUMNS,
     read_indexer_covariates,
     read_indexer_entities,
     read_indexer_relationships,
     read_indexer_reports,
     read_indexer_text_units,
 )
+from .structured_search.base import BaseSearch
+from .structured_search.global_search.search import GlobalSearch
+from .structured_search.local_search.search import LocalSearch
 
-reporter = PrintProgressReporter("")
+
+class _QuietProgressReporter(PrintProgressReporter):
+    """A print reporter that only reports results, warnings and errors."""
+
+    def __call__(self, update: Progress) -> None:
+        """Update progress."""
+
+    def info(self, message: str) -> None:
+        """Report information."""
+
+
+# informational output is only worth the locked prints on an interactive terminal
+reporter: ProgressReporter = (
+    PrintProgressReporter("")
+    if sys.stdout.isatty() or os.environ.get("GRAPHRAG_VERBOSE")
+    else _QuietProgressReporter("")
+)
+log = logging.getLogger(__name__)
+
+SearchResponse = str | dict[str, Any] | list[dict[str, Any]]
+"""The response of a search engine, as typed on SearchResult."""
+
+_store_cache: dict[tuple, LanceDBVectorStore] = {}
+_store_cache_lock = threading.Lock()
 
 
 def __get_embedding_description_store(
     entities: list[Entity],
     vector_store_type: str = VectorStoreType.LanceDB,
     config_args: dict | None = None,
+    embedding_model: str = "",
 ):
     """Get the embedding description store."""
     if not config_args:
@@ -45,41 +85,101 @@ def __get_embedding_description_store(
     collection_name = config_args.get(
         "query_collection_name", "entity_description_embeddings"
     )
-    config_args.update({"collection_name": collection_name})
+    if not config_args.get("overwrite", True):
+        # load description embeddings from an existing lancedb table, skipping the
+        # factory for this hot path; to connect to a remote db, specify url and
+        # port values.
+        return _get_cached_lancedb_store(
+            config_args.get("db_uri", "./lancedb"),
+            collection_name,
+            nprobes=config_args.get("nprobes", 20),
+        )
+
+    # copy rather than update so the caller's config is never mutated
+    factory_args = {**config_args, "collection_name": collection_name}
     description_embedding_store = VectorStoreFactory.get_vector_store(
-        vector_store_type=vector_store_type, kwargs=config_args
+        vector_store_type=vector_store_type, kwargs=factory_args
     )
 
-    description_embedding_store.connect(**config_args)
+    description_embedding_store.connect(**factory_args)
 
-    if config_args.get("overwrite", True):
-        # this step assumps the embeddings where originally stored in a file rather
-        # than a vector database
+    fingerprint = _entities_fingerprint(entities, embedding_model)
+    if (
+        isinstance(description_embedding_store, LanceDBVectorStore)
+        and description_embedding_store.fingerprint == fingerprint
+    ):
+        # the table already holds the embeddings of these entities
+        description_embedding_store.connect_with_table(**factory_args)
+        return description_embedding_store
 
-        # dump embeddings from the entities list to the description_embedding_store
-        store_entity_semantic_embeddings(
-            entities=entities, vectorstore=description_embedding_store
-        )
-    else:
-        # load description embeddings to an in-memory lancedb vectorstore
-        # to connect to a remote db, specify url and port values.
-        description_embedding_store = LanceDBVectorStore(
-            collection_name=collection_name
+    # this step assumps the embeddings where originally stored in a file rather
+    # than a vector database
+
+    # dump embeddings from the entities list to the description_embedding_store
+    store_entity_semantic_embeddings(
+        entities=entities, vectorstore=description_embedding_store
+    )
+    if isinstance(description_embedding_store, LanceDBVectorStore):
+        _evict_cached_lancedb_stores(
+            config_args.get("db_uri", "./lancedb"), collection_name
         )
-        description_embedding_store.connect(
-            db_uri=config_args.get("db_uri", "./lancedb")
+        description_embedding_store.create_index(
+            num_partitions=config_args.get("num_partitions"),
+            num_sub_vectors=config_args.get("num_sub_vectors", 16),
         )
+        description_embedding_store.save_vector_matrix()
+        description_embedding_store.save_fingerprint(fingerprint)
+
+    return description_embedding_store
 
-        # load data from an existing table
-        description_embedding_store.document_collection = (
-            description_embedding_store.db_connection.open_table(
-                description_embedding_store.collection_name
-            )
-        )
 
+def _entities_fingerprint(entities: list[Entity], embedding_model: str) -> str:
+    """Fingerprint the entity documents and embedding model behind a description store.
+
+    Entity ids are deterministic across index runs, so the titles, descriptions and
+    embeddings are hashed too.
+    """
+    digest = hashlib.blake2b(embedding_model.encode("utf-8"), digest_size=16)
+    for entity in entities:
+        for field in (entity.id, entity.title, entity.description or ""):
+            digest.update(b"\0")
+            digest.update(field.encode("utf-8"))
+        digest.update(b"\0")
+        if entity.description_embedding is not None:
+            digest.update(
+                np.asarray(entity.description_embedding, dtype=np.float64).tobytes()
+            )
+    return digest.hexdigest()
+
+
+def _get_cached_lancedb_store(
+    db_uri: str, collection_name: str, **kwargs: Any
+) -> LanceDBVectorStore:
+    """Get a LanceDB store opened on an existing table, reusing the live handle across queries."""
+    key = (db_uri, collection_name, *sorted(kwargs.items()))
+    with _store_cache_lock:
+        description_embedding_store = _store_cache.get(key)
+        if description_embedding_store is None:
+            description_embedding_store = LanceDBVectorStore(
+                collection_name=collection_name, **kwargs
+            )
+            # load data from an existing table
+            description_embedding_store.connect_with_table(
+                db_uri=db_uri, collection_name=collection_name
+            )
+            _store_cache[key] = description_embedding_store
     return description_embedding_store
 
 
+def _evict_cached_lancedb_stores(db_uri: str, collection_name: str) -> None:
+    """Drop the cached stores of a table that has just been rewritten."""
+    with _store_cache_lock:
+        for key in [
+            key for key in _store_cache if key[:2] == (db_uri, collection_name)
+        ]:
+            del _store_cache[key]
+
+
 def run_global_search(
     config_dir: str | None,
     data_dir: str | None,
@@ -89,38 +189,60 @@ def run_global_search(
     query: str,
 ):
     """Run a global search with the given query."""
-    data_dir, root_dir, config = _configure_paths_and_settings(
-        data_dir, root_dir, config_dir
+    return asyncio.run(
+        arun_global_search(
+            config_dir, data_dir, root_dir, community_level, response_type, query
+        )
     )
-    data_path = Path(data_dir)
 
-    final_nodes: pd.DataFrame = pd.read_parquet(
-        data_path / "create_final_nodes.parquet"
-    )
-    final_entities: pd.DataFrame = pd.read_parquet(
-        data_path / "create_final_entities.parquet"
-    )
-    final_community_reports: pd.DataFrame = pd.read_parquet(
-        data_path / "create_final_community_reports.parquet"
-    )
 
-    reports = read_indexer_reports(
-        final_community_reports, final_nodes, community_level
-    )
-    entities = read_indexer_entities(final_nodes, final_entities, community_level)
-    search_engine = get_global_search_engine(
-        config,
-        reports=reports,
-        entities=entities,
-        response_type=response_type,
+async def arun_global_search(
+    config_dir: str | None,
+    data_dir: str | None,
+    root_dir: str | None,
+    community_level: int,
+    response_type: str,
+    query: str,
+) -> SearchResponse:
+    """Run a global search with the given query asynchronously."""
+    search_engine = await _create_global_search_engine(
+        config_dir, data_dir, root_dir, community_level, response_type
     )
 
-    result = search_engine.search(query=query)
+    result = await search_engine.asearch(query=query)
 
     reporter.success(f"Global Search Response: {result.response}")
     return result.response
 
 
+def run_global_search_batch(
+    config_dir: str | None,
+    data_dir: str | None,
+    root_dir: str | None,
+    community_level: int,
+    response_type: str,
+    queries: list[str],
+) -> list[SearchResponse | None]:
+    """Run a global search for each of the given queries, sharing one search engine.
+
+    Queries that fail are reported as errors and answered with None, so the other
+    answers are still returned in query order.
+    """
+    responses = asyncio.run(
+        _asearch_all(
+            _create_global_search_engine(
+                config_dir, data_dir, root_dir, community_level, response_type
+            ),
+            queries,
+        )
+    )
+
+    for response in responses:
+        if response is not None:
+            reporter.success(f"Global Search Response: {response}")
+    return responses
+
+
 def run_local_search(
     config_dir: str | None,
     data_dir: str | None,
@@ -130,63 +252,252 @@ def run_local_search(
     query: str,
 ):
     """Run a local search with the given query."""
+    return asyncio.run(
+        arun_local_search(
+            config_dir, data_dir, root_dir, community_level, response_type, query
+        )
+    )
+
+
+async def arun_local_search(
+    config_dir: str | None,
+    data_dir: str | None,
+    root_dir: str | None,
+    community_level: int,
+    response_type: str,
+    query: str,
+) -> SearchResponse:
+    """Run a local search with the given query asynchronously."""
+    search_engine = await _create_local_search_engine(
+        config_dir, data_dir, root_dir, community_level, response_type
+    )
+
+    result = await search_engine.asearch(query=query)
+    reporter.success(f"Local Search Response: {result.response}")
+    return result.response
+
+
+def run_local_search_batch(
+    config_dir: str | None,
+    data_dir: str | None,
+    root_dir: str | None,
+    community_level: int,
+    response_type: str,
+    queries: list[str],
+) -> list[SearchResponse | None]:
+    """Run a local search for each of the given queries, sharing one search engine.
+
+    Queries that fail are reported as errors and answered with None, so the other
+    answers are still returned in query order.
+    """
+    responses = asyncio.run(
+        _asearch_all(
+            _create_local_search_engine(
+                config_dir, data_dir, root_dir, community_level, response_type
+            ),
+            queries,
+        )
+    )
+
+    for response in responses:
+        if response is not None:
+            reporter.success(f"Local Search Response: {response}")
+    return responses
+
+
+async def _asearch_all(
+    search_engine: Awaitable[BaseSearch], queries: list[str]
+) -> list[SearchResponse | None]:
+    engine = await search_engine
+    # gather keeps the results in query order while the LLM calls overlap, and
+    # collects failures so one failing query does not discard the other answers
+    results = await asyncio.gather(
+        *[engine.asearch(query=query) for query in queries], return_exceptions=True
+    )
+    responses: list[SearchResponse | None] = []
+    for query, result in zip(queries, results, strict=True):
+        if isinstance(result, Exception):
+            reporter.error(f"Search failed for query {query!r}: {result!r}")
+            responses.append(None)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            responses.append(result.response)
+    return responses
+
+
+async def _read_parquets(data_path: Path, *names: str) -> list[pd.DataFrame]:
+    return await asyncio.gather(*[
+        asyncio.to_thread(_read_indexer_output, data_path, name) for name in names
+    ])
+
+
+def _read_indexer_output(data_path: Path, name: str) -> pd.DataFrame:
+    path = data_path / f"{name}.parquet"
+    # key on the modification time so a re-index is picked up; the frames are
+    # shared across searches, so the indexer adapters must not modify them
+    return _read_indexer_parquet(str(path), name, path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _read_indexer_parquet(
+    path: str,
+    name: str,
+    mtime_ns: int,  # noqa: ARG001
+) -> pd.DataFrame:
+    # only materialize the columns the indexer adapters consume, and keep
+    # low-cardinality strings dictionary-encoded as categoricals
+    available = set(pq.read_schema(path).names)
+    return pd.read_parquet(
+        path,
+        columns=[
+            column for column in INDEXER_OUTPUT_COLUMNS[name] if column in available
+        ],
+        read_dictionary=[
+            column
+            for column in INDEXER_CATEGORICAL_COLUMNS.get(name, [])
+            if column in available
+        ],
+    )
+
+
+async def _create_global_search_engine(
+    config_dir: str | None,
+    data_dir: str | None,
+    root_dir: str | None,
+    community_level: int,
+    response_type: str,
+) -> GlobalSearch:
     data_dir, root_dir, config = _configure_paths_and_settings(
         data_dir, root_dir, config_dir
     )
-    data_path = Path(data_dir)
 
-    final_nodes = pd.read_parquet(data_path / "create_final_nodes.parquet")
-    final_community_reports = pd.read_parquet(
-        data_path / "create_final_community_reports.parquet"
+    final_nodes, final_entities, final_community_reports = await _read_parquets(
+        Path(data_dir),
+        "create_final_nodes",
+        "create_final_entities",
+        "create_final_community_reports",
     )
-    final_text_units = pd.read_parquet(data_path / "create_final_text_units.parquet")
-    final_relationships = pd.read_parquet(
-        data_path / "create_final_relationships.parquet"
+
+    reports, entities = await asyncio.gather(
+        asyncio.to_thread(
+            read_indexer_reports,
+            final_community_reports,
+            final_nodes,
+            community_level,
+        ),
+        asyncio.to_thread(
+            read_indexer_entities,
+            final_nodes,
+            final_entities,
+            community_level,
+        ),
     )
-    final_entities = pd.read_parquet(data_path / "create_final_entities.parquet")
+    return get_global_search_engine(
+        config,
+        reports=reports,
+        entities=entities,
+        response_type=response_type,
+    )
+
+
+async def _create_local_search_engine(
+    config_dir: str | None,
+    data_dir: str | None,
+    root_dir: str | None,
+    community_level: int,
+    response_type: str,
+) -> LocalSearch:
+    data_dir, root_dir, config = _configure_paths_and_settings(
+        data_dir, root_dir, config_dir
+    )
+
+    data_path = Path(data_dir)
     final_covariates_path = data_path / "create_final_covariates.parquet"
-    final_covariates = (
-        pd.read_parquet(final_covariates_path)
-        if final_covariates_path.exists()
-        else None
+    final_covariates = None
+    (
+        final_nodes,
+        final_community_reports,
+        final_text_units,
+        final_relationships,
+        final_entities,
+        *optional_outputs,
+    ) = await _read_parquets(
+        data_path,
+        "create_final_nodes",
+        "create_final_community_reports",
+        "create_final_text_units",
+        "create_final_relationships",
+        "create_final_entities",
+        *(["create_final_covariates"] if final_covariates_path.exists() else []),
     )
+    if optional_outputs:
+        final_covariates = optional_outputs[0]
 
     vector_store_args = (
         config.embeddings.vector_store if config.embeddings.vector_store else {}
     )
 
-    reporter.info(f"Vector Store Args: {vector_store_args}")
+    log.debug("Vector Store Args: %s", vector_store_args)
     vector_store_type = vector_store_args.get("type", VectorStoreType.LanceDB)
 
-    entities = read_indexer_entities(final_nodes, final_entities, community_level)
-    description_embedding_store = __get_embedding_description_store(
-        entities=entities,
-        vector_store_type=vector_store_type,
-        config_args=vector_store_args,
+    # the indexer adapters are independent pandas passes, so run them side by side;
+    # the embedding store only waits on the entities it may need to dump
+    entities_task = asyncio.ensure_future(
+        asyncio.to_thread(
+            read_indexer_entities,
+            final_nodes,
+            final_entities,
+            community_level,
+        )
     )
-    covariates = (
-        read_indexer_covariates(final_covariates)
-        if final_covariates is not None
-        else []
+
+    async def get_description_embedding_store() -> BaseVectorStore:
+        return await asyncio.to_thread(
+            __get_embedding_description_store,
+            entities=await entities_task,
+            vector_store_type=vector_store_type,
+            config_args=vector_store_args,
+            embedding_model=config.embeddings.llm.model,
+        )
+
+    async def get_covariates() -> list[Covariate]:
+        if final_covariates is None:
+            return []
+        return await asyncio.to_thread(read_indexer_covariates, final_covariates)
+
+    (
+        entities,
+        description_embedding_store,
+        covariates,
+        reports,
+        text_units,
+        relationships,
+    ) = await asyncio.gather(
+        entities_task,
+        get_description_embedding_store(),
+        get_covariates(),
+        asyncio.to_thread(
+            read_indexer_reports,
+            final_community_reports,
+            final_nodes,
+            community_level,
+        ),
+        asyncio.to_thread(read_indexer_text_units, final_text_units),
+        asyncio.to_thread(read_indexer_relationships, final_relationships),
     )
 
-    search_engine = get_local_search_engine(
+    return get_local_search_engine(
         config,
-        reports=read_indexer_reports(
-            final_community_reports, final_nodes, community_level
-        ),
-        text_units=read_indexer_text_units(final_text_units),
+        reports=reports,
+        text_units=text_units,
         entities=entities,
-        relationships=read_indexer_relationships(final_relationships),
+        relationships=relationships,
         covariates={"claims": covariates},
         description_embedding_store=description_embedding_store,
         response_type=response_type,
     )
 
-    result = search_engine.search(query=query)
-    reporter.success(f"Local Search Response: {result.response}")
-    return result.response
-
 
 def _configure_paths_and_settings(
     data_dir: str | None,
@@ -234,13 +545,7 @@ def _read_config_parameters(root: str, config: str | None):
 
     if settings_yaml.exists():
         reporter.info(f"Reading settings from {settings_yaml}")
-        with settings_yaml.open(
-            "rb",
-        ) as file:
-            import yaml
-
-            data = yaml.safe_load(file.read().decode(encoding="utf-8", errors="strict"))
-            return create_graphrag_config(data, root)
+        return read_settings_file(root, settings_yaml)
 
     settings_json = (
         Path(config)
@@ -249,11 +554,7 @@ def _read_config_parameters(root: str, config: str | None):
     )
     if settings_json.exists():
         reporter.info(f"Reading settings from {settings_json}")
-        with settings_json.open("rb") as file:
-            import json
-
-            data = json.loads(file.read().decode(encoding="utf-8", errors="strict"))
-            return create_graphrag_config(data, root)
+        return read_settings_file(root, settings_json)
 
     reporter.info("Reading settings from environment variables")
     return create_graphrag_config(root_dir=root)
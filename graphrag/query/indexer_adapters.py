@@ -19,6 +19,66 @@ from graphrag.query.input.loaders.dfs import (
     read_text_units,
 )
 
+INDEXER_OUTPUT_COLUMNS: dict[str, list[str]] = {
+    "create_final_nodes": ["title", "degree", "community", "level"],
+    "create_final_entities": [
+        "id",
+        "name",
+        "type",
+        "human_readable_id",
+        "description",
+        "description_embedding",
+        "text_unit_ids",
+    ],
+    "create_final_community_reports": [
+        "community",
+        "level",
+        "title",
+        "summary",
+        "full_content",
+        "rank",
+    ],
+    "create_final_text_units": [
+        "id",
+        "text",
+        "entity_ids",
+        "relationship_ids",
+        "n_tokens",
+        "document_ids",
+        "text_embedding",
+    ],
+    "create_final_relationships": [
+        "id",
+        "human_readable_id",
+        "source",
+        "target",
+        "description",
+        "weight",
+        "text_unit_ids",
+        "rank",
+    ],
+    "create_final_covariates": [
+        "id",
+        "human_readable_id",
+        "subject_id",
+        "subject_type",
+        "covariate_type",
+        "object_id",
+        "status",
+        "start_date",
+        "end_date",
+        "description",
+        "document_ids",
+    ],
+}
+"""The columns of each indexer output that the read_indexer_* adapters consume."""
+
+INDEXER_CATEGORICAL_COLUMNS: dict[str, list[str]] = {
+    "create_final_entities": ["type"],
+    "create_final_covariates": ["subject_type", "covariate_type"],
+}
+"""Low-cardinality string columns that can be loaded as categoricals."""
+
 
 def read_indexer_text_units(final_text_units: pd.DataFrame) -> list[TextUnit]:
     """Read in the Text Units from the raw indexing outputs."""
@@ -32,8 +92,7 @@ def read_indexer_text_units(final_text_units: pd.DataFrame) -> list[TextUnit]:
 
 def read_indexer_covariates(final_covariates: pd.DataFrame) -> list[Covariate]:
     """Read in the Claims from the raw indexing outputs."""
-    covariate_df = final_covariates
-    covariate_df["id"] = covariate_df["id"].astype(str)
+    covariate_df = final_covariates.assign(id=final_covariates["id"].astype(str))
     return read_covariates(
         df=covariate_df,
         short_id_col="human_readable_id",
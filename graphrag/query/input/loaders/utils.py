@@ -27,7 +27,8 @@ def to_optional_str(data: pd.Series, column_name: str | None) -> str | None:
 
     if column_name in data:
         value = data[column_name]
-        if value is None:
+        # categorical columns surface missing values as NaN rather than None
+        if value is None or (isinstance(value, float) and np.isnan(value)):
             return None
         return str(data[column_name])
     msg = f"Column {column_name} not found in data"
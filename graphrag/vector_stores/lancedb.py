@@ -7,65 +7,184 @@ import lancedb as lancedb  # noqa: I001 (Ruff was breaking on this file imports,
 from graphrag.model.types import TextEmbedder
 
 import json
+import math
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pyarrow as pa
 
+from ._cosine_topk import topk_cosine
 from .base import (
     BaseVectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
 )
 
+LOAD_BATCH_SIZE: int = 10_000
+"""Number of documents written to LanceDB per columnar batch."""
+
+VECTOR_DTYPE = np.float16
+"""Embeddings are persisted at half precision to halve the bytes scanned per query."""
+
+MIN_INDEX_ROW_COUNT: int = 10_000
+"""Below this many rows an exact scan is cheap enough that no ANN index is built."""
+
 
 class LanceDBVectorStore(BaseVectorStore):
     """The LanceDB vector storage implementation."""
 
+    db_uri: str | None = None
+    _has_ann_index: bool | None = None
+    _vector_matrix: tuple[np.ndarray, pa.Table] | None = None
+
     def connect(self, **kwargs: Any) -> Any:
         """Connect to the vector storage."""
         db_uri = kwargs.get("db_uri", "./lancedb")
         self.db_connection = lancedb.connect(db_uri)  # type: ignore
+        self.db_uri = db_uri
+        self._has_ann_index = None
+        self._vector_matrix = None
+
+    def connect_with_table(self, **kwargs: Any) -> Any:
+        """Connect to the vector storage and open an existing table in one step."""
+        self.connect(**kwargs)
+        self.collection_name = kwargs.get("collection_name", self.collection_name)
+        self.document_collection = self.db_connection.open_table(self.collection_name)
 
     def load_documents(
         self, documents: list[VectorStoreDocument], overwrite: bool = True
     ) -> None:
         """Load documents into vector storage."""
-        data = [
-            {
-                "id": document.id,
-                "text": document.text,
-                "vector": document.vector,
-                "attributes": json.dumps(document.attributes),
-            }
-            for document in documents
-            if document.vector is not None
+        documents = [document for document in documents if document.vector is not None]
+        # write in fixed-size columnar batches to amortize the per-commit cost
+        # while keeping peak memory bounded
+        batches = [
+            documents[i : i + LOAD_BATCH_SIZE]
+            for i in range(0, len(documents), LOAD_BATCH_SIZE)
         ]
 
-        if len(data) == 0:
-            data = None
-
         schema = pa.schema([
             pa.field("id", pa.string()),
             pa.field("text", pa.string()),
-            pa.field("vector", pa.list_(pa.float64())),
+            pa.field("vector", pa.list_(pa.from_numpy_dtype(VECTOR_DTYPE))),
             pa.field("attributes", pa.string()),
         ])
+        if not overwrite:
+            # add data to existing table
+            self.document_collection = self.db_connection.open_table(
+                self.collection_name
+            )
+            # an empty table has no vector dimension to search on, so it is
+            # recreated from the first batch instead
+            overwrite = bool(batches) and self.document_collection.count_rows() == 0
+
         if overwrite:
-            if data:
+            if batches:
                 self.document_collection = self.db_connection.create_table(
-                    self.collection_name, data=data, mode="overwrite"
+                    self.collection_name,
+                    data=_to_arrow_table(batches.pop(0)),
+                    mode="overwrite",
                 )
             else:
                 self.document_collection = self.db_connection.create_table(
                     self.collection_name, schema=schema, mode="overwrite"
                 )
-        else:
-            # add data to existing table
-            self.document_collection = self.db_connection.open_table(
-                self.collection_name
-            )
-            if data:
-                self.document_collection.add(data)
+
+        # match the vectors to the table, which may predate the current precision
+        vector_type = self.document_collection.schema.field("vector").type
+        for batch in batches:
+            self.document_collection.add(_to_arrow_table(batch, vector_type))
+
+        # any previously saved matrix or fingerprint no longer reflects the table;
+        # the fingerprint goes first so it never vouches for a stale matrix
+        self._has_ann_index = None
+        self._vector_matrix = None
+        for path in [self._sidecar_path("fingerprint"), *(self._matrix_paths() or ())]:
+            if path is not None:
+                path.unlink(missing_ok=True)
+
+    def create_index(
+        self, num_partitions: int | None = None, num_sub_vectors: int = 16
+    ) -> None:
+        """Build an IVF_PQ ANN index on the vector column.
+
+        The number of partitions defaults to the square root of the row count.
+        """
+        row_count = self.document_collection.count_rows()
+        if row_count < MIN_INDEX_ROW_COUNT:
+            return
+
+        self.document_collection.create_index(
+            metric="cosine",
+            num_partitions=num_partitions or int(math.sqrt(row_count)),
+            num_sub_vectors=num_sub_vectors,
+            vector_column_name="vector",
+            replace=True,
+        )
+        self._has_ann_index = True
+
+    def save_vector_matrix(self) -> None:
+        """Persist the vectors next to the table as a memory-mappable .npy file.
+
+        Query workers map these files read-only, so the OS page cache keeps a single
+        copy of the matrix shared by every process. Rows are L2-normalized, so a dot
+        product with a normalized query gives the cosine similarity directly. The rows
+        themselves are saved alongside in the Arrow IPC format, in matrix order, so a
+        match is resolved by position rather than by scanning the table. Tables with an
+        ANN index are searched through the index, so no matrix is saved for them.
+        """
+        paths = self._matrix_paths()
+        if paths is None or self._ann_index_exists():
+            return
+
+        table = self.document_collection.to_arrow()
+        vectors = table.column("vector").combine_chunks()
+        matrix = (
+            vectors.flatten()
+            .to_numpy(zero_copy_only=False)
+            .reshape(len(vectors), -1)
+            .astype(np.float32)
+        )
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+        # other workers may be mapping these files, so each one is swapped into
+        # place whole, rows before vectors: new vectors always come with new rows
+        vectors_path, rows_path = paths
+        with (
+            _atomic_write(rows_path) as sink_path,
+            pa.OSFile(str(sink_path), "wb") as sink,
+            pa.ipc.new_file(sink, table.schema) as writer,
+        ):
+            writer.write_table(table)
+        with _atomic_write(vectors_path) as sink_path, sink_path.open("wb") as file:
+            np.save(file, np.ascontiguousarray(matrix, dtype=VECTOR_DTYPE))
+        self._vector_matrix = None
+
+    @property
+    def vector_matrix_mmap(self) -> np.ndarray | None:
+        """The read-only memory-mapped vector matrix, if one was saved."""
+        vector_matrix = self._load_vector_matrix()
+        return vector_matrix[0] if vector_matrix else None
+
+    @property
+    def fingerprint(self) -> str | None:
+        """The fingerprint of the documents last loaded into the table, if recorded."""
+        path = self._sidecar_path("fingerprint")
+        if path is None or not path.exists():
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def save_fingerprint(self, fingerprint: str) -> None:
+        """Record a fingerprint of the documents currently loaded into the table."""
+        path = self._sidecar_path("fingerprint")
+        if path is not None:
+            with _atomic_write(path) as sink_path:
+                sink_path.write_text(fingerprint, encoding="utf-8")
 
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
@@ -85,32 +204,83 @@ class LanceDBVectorStore(BaseVectorStore):
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
         """Perform a vector-based similarity search."""
-        if self.query_filter:
-            docs = (
-                self.document_collection.search(query=query_embedding)
-                .where(self.query_filter, prefilter=True)
-                .limit(k)
-                .to_list()
-            )
-        else:
-            docs = (
-                self.document_collection.search(query=query_embedding)
-                .limit(k)
-                .to_list()
+        if not self.query_filter:
+            vector_matrix = self._load_vector_matrix()
+            if vector_matrix is not None and not self._ann_index_exists():
+                return self._exact_search(vector_matrix, query_embedding, k)
+
+        query = (
+            self.document_collection.search(
+                query=np.asarray(query_embedding, dtype=VECTOR_DTYPE)
             )
+            .metric("cosine")  # type: ignore
+            .nprobes(self.kwargs.get("nprobes", 20))
+        )
+        if self.query_filter:
+            query = query.where(self.query_filter, prefilter=True)
+        docs = query.limit(k).to_list()
         return [
             VectorStoreSearchResult(
-                document=VectorStoreDocument(
-                    id=doc["id"],
-                    text=doc["text"],
-                    vector=doc["vector"],
-                    attributes=json.loads(doc["attributes"]),
-                ),
+                document=_to_document(doc),
                 score=1 - abs(float(doc["_distance"])),
             )
             for doc in docs
         ]
 
+    def _exact_search(
+        self,
+        vector_matrix: tuple[np.ndarray, pa.Table],
+        query_embedding: list[float],
+        k: int,
+    ) -> list[VectorStoreSearchResult]:
+        """Brute-force cosine search over the memory-mapped matrix."""
+        matrix, rows = vector_matrix
+        top_k, scores = topk_cosine(matrix, np.asarray(query_embedding), k)
+        docs = rows.take(pa.array(top_k, type=pa.int64())).to_pylist()
+        return [
+            VectorStoreSearchResult(document=_to_document(doc), score=float(score))
+            for doc, score in zip(docs, scores, strict=True)
+        ]
+
+    def _ann_index_exists(self) -> bool:
+        if self._has_ann_index is None:
+            # only called for local tables, which expose the underlying Lance dataset
+            self._has_ann_index = (
+                len(self.document_collection.to_lance().list_indices()) > 0  # type: ignore
+            )
+        return self._has_ann_index
+
+    def _load_vector_matrix(self) -> tuple[np.ndarray, pa.Table] | None:
+        if self._vector_matrix is None:
+            paths = self._matrix_paths()
+            if paths is None or not all(path.exists() for path in paths):
+                return None
+            vectors_path, rows_path = paths
+            try:
+                matrix = np.load(vectors_path, mmap_mode="r")
+                rows = pa.ipc.open_file(pa.memory_map(str(rows_path), "r")).read_all()
+            except FileNotFoundError:
+                # removed by a concurrent load_documents
+                return None
+            if len(rows) != len(matrix):
+                # caught between the rows and the vectors of a concurrent save
+                return None
+            self._vector_matrix = (matrix, rows)
+        return self._vector_matrix
+
+    def _matrix_paths(self) -> tuple[Path, Path] | None:
+        vectors_path = self._sidecar_path("vectors.npy")
+        rows_path = self._sidecar_path("rows.arrow")
+        if vectors_path is None or rows_path is None:
+            return None
+        return vectors_path, rows_path
+
+    def _sidecar_path(self, name: str) -> Path | None:
+        # sidecar files are only kept next to local databases
+        if self.db_uri is None or "://" in self.db_uri:
+            return None
+        return Path(self.db_uri) / f"_{self.collection_name}_{name}"
+
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
@@ -119,3 +289,57 @@ class LanceDBVectorStore(BaseVectorStore):
         if query_embedding:
             return self.similarity_search_by_vector(query_embedding, k)
         return []
+
+
+def _to_arrow_table(
+    documents: list[VectorStoreDocument], vector_type: pa.DataType | None = None
+) -> pa.Table:
+    """Convert documents with vectors into a columnar Arrow table.
+
+    Vectors are stored as fixed-size VECTOR_DTYPE lists, or as the given vector type
+    of an existing table, so batches can be appended to tables written with another
+    precision or layout. The conversion goes through numpy, since Arrow cannot cast
+    half floats.
+    """
+    value_type = (
+        vector_type.value_type
+        if vector_type is not None
+        else pa.from_numpy_dtype(VECTOR_DTYPE)
+    )
+    vectors = np.ascontiguousarray(
+        [document.vector for document in documents],
+        dtype=value_type.to_pandas_dtype(),
+    )
+    values = pa.array(vectors.ravel(), type=value_type)
+    if vector_type is None or pa.types.is_fixed_size_list(vector_type):
+        vector_array = pa.FixedSizeListArray.from_arrays(values, vectors.shape[1])
+    else:
+        offsets = np.arange(0, vectors.size + 1, vectors.shape[1], dtype=np.int32)
+        vector_array = pa.ListArray.from_arrays(pa.array(offsets), values)
+    return pa.Table.from_pydict({
+        "id": [document.id for document in documents],
+        "text": [document.text for document in documents],
+        "vector": vector_array,
+        "attributes": [json.dumps(document.attributes) for document in documents],
+    })
+
+
+@contextmanager
+def _atomic_write(path: Path) -> Iterator[Path]:
+    """Yield a temporary path next to the given one, moved into place once written."""
+    sink_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        yield sink_path
+        sink_path.replace(path)
+    finally:
+        sink_path.unlink(missing_ok=True)
+
+
+def _to_document(doc: dict[str, Any]) -> VectorStoreDocument:
+    """Convert a LanceDB result row into a document."""
+    return VectorStoreDocument(
+        id=doc["id"],
+        text=doc["text"],
+        vector=doc["vector"],
+        attributes=json.loads(doc["attributes"]),
+    )
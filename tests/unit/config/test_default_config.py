@@ -58,6 +58,7 @@ from graphrag.config import (
     UmapConfig,
     UmapConfigInput,
     create_graphrag_config,
+    read_settings_file,
 )
 from graphrag.index import (
     PipelineConfig,
@@ -509,6 +510,8 @@ class TestDefaultConfig(unittest.TestCase):
             "GRAPHRAG_EMBEDDING_API_VERSION",
             "GRAPHRAG_EMBEDDING_API_ORGANIZATION",
             "GRAPHRAG_EMBEDDING_API_PROXY",
+            # Read by the query CLI reporter rather than the config
+            "GRAPHRAG_VERBOSE",
         }
         if missing:
             msg = f"{len(missing)} missing env vars: {missing}"
@@ -974,3 +977,18 @@ llm:
     assert "${PIPELINE_LLM_API_VERSION}" not in config_str
     assert "${PIPELINE_LLM_MODEL}" not in config_str
     assert "${PIPELINE_LLM_DEPLOYMENT_NAME}" not in config_str
+
+
+@mock.patch.dict(os.environ, {"GRAPHRAG_API_KEY": "first"}, clear=True)
+def test_read_settings_file_rereads_env(tmp_path: Path):
+    settings_file = tmp_path / "settings.yaml"
+    settings_file.write_text("llm:\n  api_key: ${GRAPHRAG_API_KEY}\n", encoding="utf-8")
+
+    assert read_settings_file(str(tmp_path), settings_file).llm.api_key == "first"
+
+    os.environ["GRAPHRAG_API_KEY"] = "second"
+    assert read_settings_file(str(tmp_path), settings_file).llm.api_key == "second"
+
+    del os.environ["GRAPHRAG_API_KEY"]
+    (tmp_path / ".env").write_text("GRAPHRAG_API_KEY=third\n", encoding="utf-8")
+    assert read_settings_file(str(tmp_path), settings_file).llm.api_key == "third"
@@ -0,0 +1,152 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import runpy
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import graphrag.query.cli as query_cli
+from graphrag.model import Entity
+from graphrag.query.cli import (
+    __get_embedding_description_store,
+    run_global_search_batch,
+)
+
+
+def _entities(embeddings: np.ndarray) -> list[Entity]:
+    return [
+        Entity(
+            id=f"e{i}",
+            short_id=str(i),
+            title=f"title {i}",
+            description=f"description {i}",
+            description_embedding=embedding.tolist(),
+        )
+        for i, embedding in enumerate(embeddings)
+    ]
+
+
+def _stored_vectors(store) -> np.ndarray:
+    table = store.document_collection.to_pandas().sort_values("id")
+    return np.stack(table["vector"].to_list())
+
+
+def _table_version(store) -> int:
+    return store.document_collection.version
+
+
+def test_description_store_is_rewritten_when_embeddings_change(tmp_path: Path):
+    rng = np.random.default_rng(0)
+    config_args = {"db_uri": str(tmp_path)}
+    embeddings = rng.normal(size=(3, 8))
+
+    store = __get_embedding_description_store(
+        _entities(embeddings), config_args=config_args, embedding_model="model"
+    )
+    version = _table_version(store)
+
+    store = __get_embedding_description_store(
+        _entities(embeddings), config_args=config_args, embedding_model="model"
+    )
+    assert _table_version(store) == version
+
+    changed_embeddings = rng.normal(size=(3, 8))
+    store = __get_embedding_description_store(
+        _entities(changed_embeddings), config_args=config_args, embedding_model="model"
+    )
+    assert _table_version(store) > version
+    assert np.allclose(_stored_vectors(store), changed_embeddings, atol=1e-2)
+
+
+def test_cached_store_is_reused_until_the_table_is_rewritten(tmp_path: Path):
+    rng = np.random.default_rng(0)
+    config_args = {"db_uri": str(tmp_path)}
+    cached_config_args = {**config_args, "overwrite": False}
+    __get_embedding_description_store(
+        _entities(rng.normal(size=(3, 8))), config_args=config_args
+    )
+
+    store = __get_embedding_description_store([], config_args=cached_config_args)
+    assert (
+        __get_embedding_description_store([], config_args=cached_config_args) is store
+    )
+
+    changed_embeddings = rng.normal(size=(3, 8))
+    __get_embedding_description_store(
+        _entities(changed_embeddings), config_args=config_args
+    )
+
+    reloaded = __get_embedding_description_store([], config_args=cached_config_args)
+    assert reloaded is not store
+    assert np.allclose(_stored_vectors(reloaded), changed_embeddings, atol=1e-2)
+
+
+class _FakeSearchEngine:
+    async def asearch(self, query: str) -> SimpleNamespace:
+        if query == "fail":
+            msg = "LLM call failed"
+            raise RuntimeError(msg)
+        return SimpleNamespace(response=f"answer to {query}")
+
+
+async def _create_fake_search_engine(*args) -> _FakeSearchEngine:
+    await asyncio.sleep(0)
+    return _FakeSearchEngine()
+
+
+def test_batch_search_keeps_answers_of_successful_queries(monkeypatch):
+    reporter = mock.Mock()
+    monkeypatch.setattr(query_cli, "reporter", reporter)
+    monkeypatch.setattr(
+        query_cli, "_create_global_search_engine", _create_fake_search_engine
+    )
+
+    responses = run_global_search_batch(
+        None, "output", None, 2, "Single Paragraph", ["first", "fail", "last"]
+    )
+
+    assert responses == ["answer to first", None, "answer to last"]
+    reporter.error.assert_called_once()
+    assert "'fail'" in reporter.error.call_args.args[0]
+    assert reporter.success.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("method", "queries", "entrypoint", "query_arg"),
+    [
+        ("local", ["q1"], "run_local_search", "q1"),
+        ("local", ["q1", "q2"], "run_local_search_batch", ["q1", "q2"]),
+        ("global", ["q1"], "run_global_search", "q1"),
+        ("global", ["q1", "q2"], "run_global_search_batch", ["q1", "q2"]),
+    ],
+)
+def test_main_dispatches_on_query_count(
+    monkeypatch, method, queries, entrypoint, query_arg
+):
+    entrypoints = {
+        name: mock.Mock()
+        for name in [
+            "run_local_search",
+            "run_local_search_batch",
+            "run_global_search",
+            "run_global_search_batch",
+        ]
+    }
+    for name, entrypoint_mock in entrypoints.items():
+        monkeypatch.setattr(query_cli, name, entrypoint_mock)
+    monkeypatch.setattr(
+        sys, "argv", ["graphrag.query", "--method", method, "--data", "out", *queries]
+    )
+
+    runpy.run_module("graphrag.query", run_name="__main__")
+
+    entrypoints.pop(entrypoint).assert_called_once_with(
+        None, "out", ".", 2, "Multiple Paragraphs", query_arg
+    )
+    for entrypoint_mock in entrypoints.values():
+        entrypoint_mock.assert_not_called()
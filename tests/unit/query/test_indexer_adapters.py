@@ -0,0 +1,124 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from graphrag.query.cli import _read_indexer_output
+from graphrag.query.indexer_adapters import (
+    read_indexer_covariates,
+    read_indexer_entities,
+    read_indexer_relationships,
+    read_indexer_reports,
+    read_indexer_text_units,
+)
+
+INDEXER_OUTPUTS = {
+    "create_final_nodes": pd.DataFrame({
+        "id": ["n0", "n1", "n2"],
+        "title": ["A", "B", "C"],
+        "type": ["PERSON", "PLACE", "PERSON"],
+        "description": ["a", "b", "c"],
+        "degree": [2, 1, 1],
+        "community": ["0", "0", "1"],
+        "level": [0, 0, 0],
+        "graph_embedding": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
+        "x": [0.0, 1.0, 2.0],
+        "y": [0.0, 1.0, 2.0],
+    }),
+    "create_final_entities": pd.DataFrame({
+        "id": ["e0", "e1", "e2"],
+        "name": ["A", "B", "C"],
+        "type": ["PERSON", "PLACE", "PERSON"],
+        "human_readable_id": [0, 1, 2],
+        "description": ["a", "b", "c"],
+        "description_embedding": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
+        "name_embedding": [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]],
+        "graph_embedding": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
+        "text_unit_ids": [["t0"], ["t0", "t1"], ["t1"]],
+    }),
+    "create_final_community_reports": pd.DataFrame({
+        "id": ["r0", "r1"],
+        "community": ["0", "1"],
+        "level": [0, 0],
+        "title": ["Report 0", "Report 1"],
+        "summary": ["s0", "s1"],
+        "full_content": ["f0", "f1"],
+        "full_content_json": ["{}", "{}"],
+        "findings": ["[]", "[]"],
+        "rank": [1.0, 2.0],
+        "rank_explanation": ["r", "r"],
+    }),
+    "create_final_text_units": pd.DataFrame({
+        "id": ["t0", "t1"],
+        "text": ["text 0", "text 1"],
+        "n_tokens": [10, 20],
+        "document_ids": [["d0"], ["d0"]],
+        "entity_ids": [["e0", "e1"], ["e1", "e2"]],
+        "relationship_ids": [["l0"], ["l1"]],
+        "chunk": ["c0", "c1"],
+    }),
+    "create_final_relationships": pd.DataFrame({
+        "id": ["l0", "l1"],
+        "human_readable_id": ["0", "1"],
+        "source": ["A", "B"],
+        "target": ["B", "C"],
+        "description": ["ab", "bc"],
+        "weight": [1.0, 2.0],
+        "text_unit_ids": [["t0"], ["t1"]],
+        "rank": [3, 2],
+        "source_degree": [2, 1],
+        "target_degree": [1, 1],
+    }),
+    "create_final_covariates": pd.DataFrame({
+        "id": [0, 1],
+        "human_readable_id": ["0", "1"],
+        "covariate_type": ["claim", "claim"],
+        "type": ["FRAUD", "FRAUD"],
+        "description": ["d0", "d1"],
+        "subject_id": ["A", "B"],
+        "subject_type": ["PERSON", "PLACE"],
+        "object_id": ["B", "C"],
+        "object_type": ["PLACE", "PERSON"],
+        "status": ["TRUE", "FALSE"],
+        "start_date": ["2024-01-01", "2024-01-02"],
+        "end_date": ["2024-02-01", "2024-02-02"],
+        "source_text": ["src 0", "src 1"],
+        "text_unit_id": ["t0", "t1"],
+        "document_ids": [["d0"], ["d0"]],
+        "n_tokens": [10, 20],
+    }),
+}
+
+
+@pytest.mark.parametrize(
+    ("adapter", "names", "args"),
+    [
+        (read_indexer_entities, ["create_final_nodes", "create_final_entities"], [0]),
+        (
+            read_indexer_reports,
+            ["create_final_community_reports", "create_final_nodes"],
+            [0],
+        ),
+        (read_indexer_text_units, ["create_final_text_units"], []),
+        (read_indexer_relationships, ["create_final_relationships"], []),
+        (read_indexer_covariates, ["create_final_covariates"], []),
+    ],
+)
+def test_projected_read_matches_full_read(tmp_path: Path, adapter, names, args):
+    for name in names:
+        INDEXER_OUTPUTS[name].to_parquet(tmp_path / f"{name}.parquet")
+
+    full = adapter(
+        *[pd.read_parquet(tmp_path / f"{name}.parquet") for name in names], *args
+    )
+    frames = [_read_indexer_output(tmp_path, name) for name in names]
+    unmodified = [frame.copy() for frame in frames]
+    projected = adapter(*frames, *args)
+
+    assert len(full) > 0
+    assert projected == full
+    # the projected frames are cached and shared across searches
+    for frame, expected in zip(frames, unmodified, strict=True):
+        pd.testing.assert_frame_equal(frame, expected)
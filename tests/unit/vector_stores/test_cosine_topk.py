@@ -0,0 +1,31 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import numpy as np
+import pytest
+
+from graphrag.vector_stores._cosine_topk import topk_cosine
+
+
+def test_topk_cosine_matches_numpy():
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(500, 32)).astype(np.float16)
+    query = rng.normal(size=32)
+
+    indices, scores = topk_cosine(matrix, query, 5)
+
+    expected = matrix.astype(np.float64) @ query
+    expected /= np.linalg.norm(matrix.astype(np.float64), axis=1)
+    expected /= np.linalg.norm(query)
+    expected_indices = np.argsort(-expected)[:5]
+    assert indices.tolist() == expected_indices.tolist()
+    assert np.allclose(scores, expected[expected_indices], atol=1e-5)
+
+
+def test_topk_cosine_clamps_k():
+    matrix = np.eye(3, dtype=np.float16)
+
+    indices, scores = topk_cosine(matrix, np.array([0.0, 1.0, 0.0]), 10)
+
+    assert indices.tolist()[0] == 1
+    assert len(indices) == 3
+    assert scores[0] == pytest.approx(1.0)
@@ -0,0 +1,119 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from graphrag.vector_stores.base import VectorStoreDocument
+from graphrag.vector_stores.lancedb import LanceDBVectorStore
+
+
+def _load_store(db_uri: str, vectors: np.ndarray) -> LanceDBVectorStore:
+    store = LanceDBVectorStore(collection_name="entities")
+    store.connect(db_uri=db_uri)
+    store.load_documents([
+        VectorStoreDocument(
+            id=f"e{i}",
+            text=f"text {i}",
+            vector=vector.tolist(),
+            attributes={"title": f"title {i}"},
+        )
+        for i, vector in enumerate(vectors)
+    ])
+    return store
+
+
+def test_exact_search_matches_table_search(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(200, 16))
+    store = _load_store(str(tmp_path), vectors)
+    query = (vectors[7] + 0.01).tolist()
+    expected = store.similarity_search_by_vector(query, k=5)
+
+    store.save_vector_matrix()
+    assert store.vector_matrix_mmap is not None
+    results = store.similarity_search_by_vector(query, k=5)
+
+    assert [result.document.id for result in results] == [
+        result.document.id for result in expected
+    ]
+    assert results[0].document.id == "e7"
+    assert results[0].document.text == "text 7"
+    assert results[0].document.attributes == {"title": "title 7"}
+    assert np.allclose(
+        [result.score for result in results],
+        [result.score for result in expected],
+        atol=1e-2,
+    )
+
+
+def test_vector_matrix_is_not_saved_with_an_ann_index(tmp_path):
+    store = _load_store(str(tmp_path), np.eye(4))
+    store._has_ann_index = True  # noqa: SLF001
+
+    store.save_vector_matrix()
+
+    assert store.vector_matrix_mmap is None
+
+
+def test_append_to_empty_table(tmp_path):
+    store = _load_store(str(tmp_path), np.empty((0, 4)))
+
+    store.load_documents(
+        [VectorStoreDocument(id="e0", text="text 0", vector=[1.0, 0.0, 0.0, 0.0])],
+        overwrite=False,
+    )
+
+    assert store.document_collection.count_rows() == 1
+    results = store.similarity_search_by_vector([1.0, 0.0, 0.0, 0.0], k=1)
+    assert results[0].document.id == "e0"
+
+
+@pytest.mark.parametrize(
+    "vector_type",
+    [pa.list_(pa.float32(), 4), pa.list_(pa.float64(), 4)],
+)
+def test_append_to_table_with_another_vector_type(tmp_path, vector_type):
+    store = LanceDBVectorStore(collection_name="entities")
+    store.connect(db_uri=str(tmp_path))
+    # a table written before vectors were stored at half precision
+    store.db_connection.create_table(
+        "entities",
+        data=pa.table({
+            "id": ["e0"],
+            "text": ["text 0"],
+            "vector": pa.array([[0.5, 0.5, 0.5, 0.5]], type=vector_type),
+            "attributes": ["{}"],
+        }),
+        mode="overwrite",
+    )
+
+    store.load_documents(
+        [
+            VectorStoreDocument(id=f"e{i}", text=f"text {i}", vector=vector.tolist())
+            for i, vector in enumerate(np.eye(4), start=1)
+        ],
+        overwrite=False,
+    )
+
+    assert store.document_collection.schema.field("vector").type == vector_type
+    assert store.document_collection.count_rows() == 5
+
+
+def test_mismatched_sidecars_fall_back_to_table_search(tmp_path):
+    vectors = np.random.default_rng(0).normal(size=(20, 4))
+    store = _load_store(str(tmp_path / "a"), vectors)
+    store.save_vector_matrix()
+    other = _load_store(str(tmp_path / "b"), vectors[:3])
+    other.save_vector_matrix()
+    assert not list((tmp_path / "a").glob("*.tmp"))
+
+    # rows from another save, as seen by a reader between two file swaps
+    rows_name = "_entities_rows.arrow"
+    (tmp_path / "a" / rows_name).write_bytes((tmp_path / "b" / rows_name).read_bytes())
+    reader = LanceDBVectorStore(collection_name="entities")
+    reader.connect_with_table(db_uri=str(tmp_path / "a"), collection_name="entities")
+
+    assert reader.vector_matrix_mmap is None
+    results = reader.similarity_search_by_vector(vectors[7].tolist(), k=1)
+    assert results[0].document.id == "e7"